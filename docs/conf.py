@@ -305,6 +305,10 @@ intersphinx_mapping = {
 
 autodoc_member_order = 'bysource'
 
+# httpx is an optional dependency, so autodoc must not need it installed to
+# document yourls.async_core.
+autodoc_mock_imports = ['httpx']
+
 napoleon_numpy_docstring = False
 
 inheritance_graph_attrs = dict(bgcolor='transparent', rankdir="TB")
@@ -23,6 +23,7 @@ AUTHOR, EMAIL = re.match(r'(.*) <(.*)>', AUTHOR_EMAIL).groups()
 
 requires = [
     'click',
+    'futures; python_version<"3"',
     'logbook>=0.10.0',
     'represent>=1.4.0',
     'requests',
@@ -32,11 +33,28 @@ requires = [
 
 extras_require = defaultdict(set)
 
+extras_require['async'] = [
+    'httpx',
+]
+
+extras_require['fast'] = [
+    'ijson',
+    'orjson',
+]
+
 extras_require['test'] = [
     'pytest>=2.7.3',
     'responses',
 ]
 
+# The optional speedup/async dependencies are Python-3-only; the test suite
+# skips the corresponding tests when they are not installed.
+extras_require['test:python_version>="3.7"'] = [
+    'httpx',
+    'ijson',
+    'orjson',
+]
+
 extras_require['dev'] = [
     'coverage',
     'doc8',
@@ -0,0 +1,193 @@
+# coding: utf-8
+from __future__ import absolute_import, division, print_function
+
+import asyncio
+import datetime
+
+import pytest
+
+httpx = pytest.importorskip('httpx')
+
+from yourls import (  # noqa: E402
+    DBStats, ShortenedURL, YOURLSHTTPError, YOURLSKeywordExistsError)
+from yourls.async_core import AsyncYOURLSClient  # noqa: E402
+
+APIURL = 'http://example.com/yourls-api.php'
+
+
+def make_client(json_response, status=200):
+    """Return client whose transport always answers with json_response."""
+    def handler(request):
+        return httpx.Response(status, json=json_response)
+
+    return AsyncYOURLSClient(APIURL, signature='6f344c2a8p',
+                             transport=httpx.MockTransport(handler))
+
+
+def test_shorten():
+    json_response = {
+        'message': 'http://google.com added to database',
+        'shorturl': 'http://example.com/abcde',
+        'url': {
+            'keyword': 'abcde',
+            'ip': '203.0.113.0',
+            'title': 'Google',
+            'url': 'http://google.com',
+            'date': '2015-10-31 14:31:04'
+        },
+        'status': 'success',
+        'title': 'Google',
+        'statusCode': 200
+    }
+
+    requests_seen = []
+
+    def handler(request):
+        requests_seen.append(request)
+        return httpx.Response(200, json=json_response)
+
+    client = AsyncYOURLSClient(APIURL, signature='6f344c2a8p',
+                               transport=httpx.MockTransport(handler))
+
+    actual_short_url = asyncio.run(client.shorten('http://google.com'))
+    expected_short_url = ShortenedURL(
+        shorturl='http://example.com/abcde',
+        url='http://google.com',
+        title='Google',
+        date=datetime.datetime(2015, 10, 31, 14, 31, 4),
+        ip='203.0.113.0',
+        clicks=0,
+        keyword='abcde')
+
+    assert actual_short_url == expected_short_url
+
+    params = requests_seen[0].url.params
+    assert params['action'] == 'shorturl'
+    assert params['url'] == 'http://google.com'
+    assert params['signature'] == '6f344c2a8p'
+    assert params['format'] == 'json'
+    assert 'keyword' not in params
+
+
+def test_shorten_keyword_exists():
+    json_response = {
+        'statusCode': 200,
+        'code': 'error:keyword',
+        'message': 'Short URL abcde already exists in database or is reserved',
+        'status': 'fail'
+    }
+
+    client = make_client(json_response)
+
+    with pytest.raises(YOURLSKeywordExistsError) as exc_info:
+        asyncio.run(client.shorten('http://www.bbc.co.uk', keyword='abcde'))
+
+    assert exc_info.value.keyword == 'abcde'
+
+
+def test_expand():
+    json_response = {
+        'statusCode': 200,
+        'shorturl': 'http://fraz.eu/abcde',
+        'keyword': 'abcde',
+        'message': 'success',
+        'longurl': 'http://google.com'
+    }
+
+    client = make_client(json_response)
+
+    assert asyncio.run(client.expand('abcde')) == 'http://google.com'
+
+
+def test_expand_missing():
+    json_response = {
+        'message': 'Error: short URL not found',
+        'keyword': 'vwxyz',
+        'errorCode': 404
+    }
+
+    client = make_client(json_response, status=404)
+
+    with pytest.raises(YOURLSHTTPError):
+        asyncio.run(client.expand('vwxyz'))
+
+
+def test_stats():
+    json_response = {
+        'message': 'success',
+        'stats': {
+            'total_links': '200',
+            'total_clicks': '5000'
+        },
+        'links': {
+            'link_1': {
+                'shorturl': 'http://example.com/abcde',
+                'title': 'Google',
+                'url': 'http://google.com',
+                'timestamp': '2014-09-08 20:30:17',
+                'ip': '203.0.113.0',
+                'clicks': '789'
+            },
+            'link_2': {
+                'shorturl': 'http://example.com/abc45',
+                'title': 'BBC News',
+                'url': 'https://www.bbc.co.uk/news',
+                'timestamp': '2014-12-19 16:26:39',
+                'ip': '203.0.113.0',
+                'clicks': '1364'
+            }
+        },
+        'statusCode': 200
+    }
+
+    client = make_client(json_response)
+
+    links, stats = asyncio.run(client.stats(filter='random', limit=2))
+
+    assert links == [
+        ShortenedURL(
+            shorturl='http://example.com/abcde',
+            url='http://google.com',
+            title='Google',
+            date=datetime.datetime(2014, 9, 8, 20, 30, 17),
+            ip='203.0.113.0',
+            clicks=789,
+            keyword=None),
+        ShortenedURL(
+            shorturl='http://example.com/abc45',
+            url='https://www.bbc.co.uk/news',
+            title='BBC News',
+            date=datetime.datetime(2014, 12, 19, 16, 26, 39),
+            ip='203.0.113.0',
+            clicks=1364,
+            keyword=None)
+    ]
+
+    assert stats == DBStats(total_links=200, total_clicks=5000)
+
+
+def test_db_stats():
+    json_response = {
+        'message': 'success',
+        'statusCode': 200,
+        'db-stats': {
+            'total_links': '200',
+            'total_clicks': '5000'
+        }
+    }
+
+    client = make_client(json_response)
+
+    assert asyncio.run(client.db_stats()) == DBStats(total_links=200,
+                                                     total_clicks=5000)
+
+
+def test_http_error_without_json():
+    def handler(request):
+        return httpx.Response(400, text='')
+
+    client = AsyncYOURLSClient(APIURL, signature='6f344c2a8p',
+                               transport=httpx.MockTransport(handler))
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(client.shorten('http://google.com'))
@@ -45,6 +45,26 @@ def test_authentication_parameters():
     with pytest.raises(TypeError):
         YOURLSClient(apiurl, signature='abcdefghij', password='pass')
 
+    # Empty credentials are just as invalid as missing ones
+    with pytest.raises(TypeError):
+        YOURLSClient(apiurl, signature='')
+
+    with pytest.raises(TypeError):
+        YOURLSClient(apiurl, username='', password='')
+
+    with pytest.raises(TypeError):
+        YOURLSClient(apiurl, username='user', password='')
+
+
+def test_context_manager():
+    apiurl = 'http://example.com/yourls-api.php'
+
+    with YOURLSClient(apiurl) as client:
+        assert client._session is not None
+
+    # Closed client can be closed again without error.
+    client.close()
+
 
 @responses.activate
 def test_shorten_new(yourls):
@@ -227,6 +247,78 @@ def test_expand_missing(yourls):
         yourls.expand(keyword)
 
 
+@responses.activate
+def test_bulk_expand(yourls):
+    keywords = ['abcde', 'fghij', 'klmno']
+    longurls = ['http://google.com', 'http://bbc.co.uk', 'http://gov.uk']
+
+    for keyword, longurl in zip(keywords, longurls):
+        params = dict(action='expand', shorturl=keyword)
+        json_response = {
+            'statusCode': 200,
+            'shorturl': 'http://example.com/' + keyword,
+            'keyword': keyword,
+            'message': 'success',
+            'longurl': longurl
+        }
+
+        query_url = make_url(yourls, params=params)
+        responses.add(GET, query_url, json=json_response, status=200,
+                      match_querystring=True)
+
+    assert yourls.bulk_expand(keywords, max_workers=2) == longurls
+    assert len(responses.calls) == 3
+
+
+@responses.activate
+def test_expand_cached():
+    caching_yourls = YOURLSClient(
+        apiurl='http://example.com/yourls-api.php', signature='6f344c2a8p',
+        expand_cache_ttl=60)
+
+    keyword = 'abcde'
+    params = dict(action='expand', shorturl=keyword)
+    json_response = {
+        'statusCode': 200,
+        'shorturl': 'http://fraz.eu/abcde',
+        'keyword': 'abcde',
+        'message': 'success',
+        'longurl': 'http://google.com'
+    }
+
+    query_url = make_url(caching_yourls, params=params)
+    responses.add(GET, query_url, json=json_response, status=200,
+                  match_querystring=True)
+
+    assert caching_yourls.expand(keyword) == 'http://google.com'
+    assert caching_yourls.expand(keyword) == 'http://google.com'
+
+    # Second call was served from the cache.
+    assert len(responses.calls) == 1
+
+
+@responses.activate
+def test_expand_apiurl_with_query_string():
+    client = YOURLSClient('http://example.com/yourls-api.php?foo=bar',
+                          signature='6f344c2a8p')
+
+    json_response = {
+        'statusCode': 200,
+        'shorturl': 'http://fraz.eu/abcde',
+        'keyword': 'abcde',
+        'message': 'success',
+        'longurl': 'http://google.com'
+    }
+
+    # The existing query string must be extended, not given a second '?'.
+    query_url = ('http://example.com/yourls-api.php?foo=bar&action=expand'
+                 '&shorturl=abcde&signature=6f344c2a8p&format=json')
+    responses.add(GET, query_url, json=json_response, status=200,
+                  match_querystring=True)
+
+    assert client.expand('abcde') == 'http://google.com'
+
+
 @responses.activate
 def test_url_stats(yourls):
     keyword = 'abcde'
@@ -380,6 +472,148 @@ def test_stats_zero(yourls):
     assert stats == DBStats(total_links=200, total_clicks=5000)
 
 
+@responses.activate
+def test_stats_link_order(yourls):
+    params = dict(action='stats', filter='last', limit=3)
+
+    def link(n):
+        return {
+            'shorturl': 'http://example.com/link%d' % n,
+            'title': 'Link %d' % n,
+            'url': 'http://example.com/long%d' % n,
+            'timestamp': '2015-10-09 05:46:27',
+            'ip': '203.0.113.0',
+            'clicks': '1'
+        }
+
+    # Deliberately scrambled: the ranked order must come from the numeric
+    # key suffix, not from whatever order the parsed dict happens to have.
+    json_response = {
+        'message': 'success',
+        'stats': {
+            'total_links': '200',
+            'total_clicks': '5000'
+        },
+        'links': {
+            'link_3': link(3),
+            'link_1': link(1),
+            'link_2': link(2)
+        },
+        'statusCode': 200
+    }
+
+    query_url = make_url(yourls, params=params)
+    responses.add(GET, query_url, json=json_response, status=200,
+                  match_querystring=True)
+
+    links, stats = yourls.stats(filter='last', limit=3)
+
+    assert [url.shorturl for url in links] == [
+        'http://example.com/link1',
+        'http://example.com/link2',
+        'http://example.com/link3',
+    ]
+
+
+@responses.activate
+def test_stats_streamed(yourls):
+    pytest.importorskip('ijson')
+
+    params = dict(action='stats', filter='top', limit=2000)
+
+    json_response = {
+        'message': 'success',
+        'stats': {
+            'total_links': '200',
+            'total_clicks': '5000'
+        },
+        'links': {
+            'link_1': {
+                'shorturl': 'http://example.com/abcde',
+                'title': 'Google',
+                'url': 'http://google.com',
+                'timestamp': '2014-09-08 20:30:17',
+                'ip': '203.0.113.0',
+                'clicks': '789'
+            },
+            'link_2': {
+                'shorturl': 'http://example.com/abc45',
+                'title': 'BBC News',
+                'url': 'https://www.bbc.co.uk/news',
+                'timestamp': '2014-12-19 16:26:39',
+                'ip': '203.0.113.0',
+                'clicks': '1364'
+            }
+        },
+        'statusCode': 200
+    }
+
+    db_stats_response = {
+        'message': 'success',
+        'statusCode': 200,
+        'db-stats': {
+            'total_links': '200',
+            'total_clicks': '5000'
+        }
+    }
+
+    query_url = make_url(yourls, params=params)
+    responses.add(GET, query_url, json=json_response, status=200,
+                  match_querystring=True)
+
+    # The streamed path fetches the totals with a separate db-stats call.
+    query_url = make_url(yourls, params=dict(action='db-stats'))
+    responses.add(GET, query_url, json=db_stats_response, status=200,
+                  match_querystring=True)
+
+    links, stats = yourls.stats(filter='top', limit=2000)
+
+    assert links == [
+        ShortenedURL(
+            shorturl='http://example.com/abcde',
+            url='http://google.com',
+            title='Google',
+            date=datetime.datetime(2014, 9, 8, 20, 30, 17),
+            ip='203.0.113.0',
+            clicks=789,
+            keyword=None),
+        ShortenedURL(
+            shorturl='http://example.com/abc45',
+            url='https://www.bbc.co.uk/news',
+            title='BBC News',
+            date=datetime.datetime(2014, 12, 19, 16, 26, 39),
+            ip='203.0.113.0',
+            clicks=1364,
+            keyword=None)
+    ]
+
+    assert stats == DBStats(total_links=200, total_clicks=5000)
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_stats_streamed_api_error(yourls):
+    pytest.importorskip('ijson')
+
+    params = dict(action='stats', filter='top', limit=2000)
+
+    json_response = {
+        'status': 'fail',
+        'message': 'something went wrong',
+        'code': 'error:dragons',
+        'statusCode': 200
+    }
+
+    query_url = make_url(yourls, params=params)
+    responses.add(GET, query_url, json=json_response, status=200,
+                  match_querystring=True)
+
+    # An HTTP 200 response reporting failure must raise like the buffered
+    # path, not return an empty link list.
+    with pytest.raises(YOURLSAPIError):
+        yourls.stats(filter='top', limit=2000)
+
+
 def test_stats_invalid_filter(yourls):
     with pytest.raises(ValueError):
         yourls.stats(filter='Midnight', limit=5)
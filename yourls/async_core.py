@@ -0,0 +1,166 @@
+# coding: utf-8
+"""Asynchronous YOURLS client built on :py:mod:`httpx`.
+
+Many in-flight requests are multiplexed over a small pool of persistent
+connections, without the thread-per-request ceiling of
+:py:meth:`~yourls.YOURLSAPIMixin.bulk_expand`.
+
+This module requires the optional httpx dependency::
+
+    pip install yourls[async]
+"""
+from __future__ import absolute_import, division, print_function
+
+import httpx
+
+from .core import (
+    _FILTER_ALIASES, _INVALID_FILTER_MSG, _VALID_FILTERS, _build_auth_params,
+    _link_sort_key)
+from .data import (
+    DBStats, _check_api_status, _handle_api_error_with_json,
+    _json_to_shortened_url, _response_json, _to_int)
+from .log import logger
+
+
+def _validate_yourls_response(response, data):
+    """Validate response from YOURLS server.
+
+    httpx counterpart of :py:func:`yourls.data._validate_yourls_response`.
+    """
+    try:
+        response.raise_for_status()
+    except httpx.HTTPStatusError as http_exc:
+        try:
+            jsondata = _response_json(response)
+        except ValueError:
+            raise http_exc
+
+        logger.debug('Received error {response} with JSON {json}',
+                     response=response, json=jsondata)
+        _handle_api_error_with_json(http_exc, jsondata, response)
+    else:
+        jsondata = _response_json(response)
+
+        logger.debug('Received {response} with JSON {json}', response=response,
+                     json=jsondata)
+
+        return _check_api_status(jsondata, data)
+
+
+class AsyncYOURLSClientBase(object):
+    """Base class for async YOURLS client.
+
+    Accepts the same authentication parameters as
+    :py:class:`yourls.YOURLSClientBase`. Remaining keyword arguments are
+    passed through to :py:class:`httpx.AsyncClient`, e.g. ``transport`` or
+    ``limits``.
+    """
+    def __init__(self, apiurl, username=None, password=None, signature=None,
+                 **httpx_kwargs):
+        self.apiurl = apiurl
+
+        self._data = _build_auth_params(username, password, signature)
+        httpx_kwargs.setdefault(
+            'limits', httpx.Limits(max_keepalive_connections=16))
+        self._client = httpx.AsyncClient(**httpx_kwargs)
+
+    async def _api_request(self, params):
+        params = dict(params, **self._data)
+        params = {key: value for key, value in params.items()
+                  if value is not None}
+
+        response = await self._client.get(self.apiurl, params=params)
+        jsondata = _validate_yourls_response(response, params)
+        return jsondata
+
+    async def close(self):
+        """Close the underlying client and its pooled connections."""
+        await self._client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+
+class AsyncYOURLSAPIMixin(object):
+    """Mixin to provide default YOURLS API methods as coroutines."""
+    async def shorten(self, url, keyword=None, title=None):
+        """Shorten URL with optional keyword and title.
+
+        Coroutine counterpart of :py:meth:`yourls.YOURLSAPIMixin.shorten`.
+        """
+        data = {'action': 'shorturl', 'url': url, 'keyword': keyword,
+                'title': title}
+        jsondata = await self._api_request(params=data)
+
+        url = _json_to_shortened_url(jsondata['url'], jsondata['shorturl'])
+
+        return url
+
+    async def expand(self, short):
+        """Expand short URL or keyword to long URL.
+
+        Coroutine counterpart of :py:meth:`yourls.YOURLSAPIMixin.expand`.
+        """
+        data = {'action': 'expand', 'shorturl': short}
+        jsondata = await self._api_request(params=data)
+
+        return jsondata['longurl']
+
+    async def url_stats(self, short):
+        """Get stats for short URL or keyword.
+
+        Coroutine counterpart of :py:meth:`yourls.YOURLSAPIMixin.url_stats`.
+        """
+        data = {'action': 'url-stats', 'shorturl': short}
+        jsondata = await self._api_request(params=data)
+
+        return _json_to_shortened_url(jsondata['link'])
+
+    async def stats(self, filter, limit, start=None):
+        """Get stats about links.
+
+        Coroutine counterpart of :py:meth:`yourls.YOURLSAPIMixin.stats`.
+        """
+        filter = _FILTER_ALIASES.get(filter, filter)
+
+        if filter not in _VALID_FILTERS:
+            raise ValueError(_INVALID_FILTER_MSG)
+
+        data = {'action': 'stats', 'filter': filter, 'limit': limit,
+                'start': start}
+        jsondata = await self._api_request(params=data)
+
+        statsdata = jsondata['stats']
+        stats = DBStats(total_clicks=_to_int(statsdata['total_clicks']),
+                        total_links=_to_int(statsdata['total_links']))
+
+        links_data = jsondata.get('links')
+        if links_data:
+            convert = _json_to_shortened_url
+            keys = sorted(links_data, key=_link_sort_key)
+            links = [convert(links_data[key]) for key in keys]
+        else:
+            links = []
+
+        return links, stats
+
+    async def db_stats(self):
+        """Get database statistics.
+
+        Coroutine counterpart of :py:meth:`yourls.YOURLSAPIMixin.db_stats`.
+        """
+        data = {'action': 'db-stats'}
+        jsondata = await self._api_request(params=data)
+
+        statsdata = jsondata['db-stats']
+        stats = DBStats(total_clicks=_to_int(statsdata['total_clicks']),
+                        total_links=_to_int(statsdata['total_links']))
+
+        return stats
+
+
+class AsyncYOURLSClient(AsyncYOURLSAPIMixin, AsyncYOURLSClientBase):
+    """Asynchronous YOURLS client."""
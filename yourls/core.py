@@ -1,37 +1,176 @@
 # coding: utf-8
 from __future__ import absolute_import, division, print_function
 
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
+from requests.adapters import HTTPAdapter
+from six.moves.urllib.parse import urlencode
+from urllib3.util.retry import Retry
+
+try:
+    from time import monotonic as _now
+except ImportError:  # Python 2
+    from time import time as _now
+
+try:
+    import ijson
+    from ijson.common import ObjectBuilder
+except ImportError:
+    ijson = None
 
 from .data import (
-    DBStats, _json_to_shortened_url, _validate_yourls_response)
+    DBStats, _check_api_status, _json_to_shortened_url, _to_int,
+    _validate_yourls_response)
 
+# Normalise random to rand, even though it's accepted by API.
+_FILTER_ALIASES = {'random': 'rand'}
+_VALID_FILTERS = frozenset(('top', 'bottom', 'rand', 'last'))
+_INVALID_FILTER_MSG = 'filter must be one of top, bottom, rand, last'
 
-class YOURLSClientBase(object):
-    """Base class for YOURLS client that provides initialiser and api request method."""
-    def __init__(self, apiurl, username=None, password=None, signature=None):
-        self.apiurl = apiurl
-        if username and password and signature is None:
-            self._data = dict(username=username, password=password)
-        elif username is None and password is None and signature:
-            self._data = dict(signature=signature)
-        elif username is None and password is None and signature is None:
-            self._data = dict()
+# Link count above which stats() switches to stream-parsing the response,
+# when ijson is available.
+_STREAM_LINK_THRESHOLD = 1000
+
+
+def _link_sort_key(key):
+    """Numeric rank of a 'link_N' key in a stats response."""
+    return int(key.rsplit('_', 1)[1])
+
+
+# Validity of authentication parameter combinations, indexed by
+# (username given) << 2 | (password given) << 1 | (signature given). Valid:
+# no authentication, signature only, or username and password together.
+_VALID_AUTH = (True, True, False, False, False, False, True, False)
+
+
+def _build_auth_params(username, password, signature):
+    """Validate authentication parameters and build the constant payload.
+
+    The YOURLS API only accepts credentials as request parameters, not HTTP
+    Basic auth, so they have to go in the query string.
+    """
+    index = (username is not None) << 2
+    index |= (password is not None) << 1
+    index |= signature is not None
+
+    if _VALID_AUTH[index]:
+        if signature is not None:
+            data = dict(signature=signature)
+        elif username is not None:
+            data = dict(username=username, password=password)
         else:
-            raise TypeError(
-                'If server requires authentication, either pass username and '
-                'password or signature. Otherwise, leave set to default (None)')
+            data = dict()
+    else:
+        data = None
 
-        self._data['format'] = 'json'
+    # Reject empty strings as well as invalid combinations: empty credentials
+    # have never been accepted.
+    if data is None or not all(data.values()):
+        raise TypeError(
+            'If server requires authentication, either pass username and '
+            'password or signature. Otherwise, leave set to default (None)')
+
+    data['format'] = 'json'
+    return data
 
-    def _api_request(self, params):
-        params = params.copy()
-        params.update(self._data)
 
-        response = requests.get(self.apiurl, params=params)
+class YOURLSClientBase(object):
+    """Base class for YOURLS client that provides initialiser and api request method.
+
+    Parameters:
+        apiurl: URL of the YOURLS API endpoint.
+        username: Username, if server requires authentication.
+        password: Password, if server requires authentication.
+        signature: Signature, as alternative to username and password.
+        expand_cache_ttl: Optionally cache :py:meth:`~.YOURLSAPIMixin.expand`
+            and :py:meth:`~.YOURLSAPIMixin.url_stats` responses for this many
+            seconds, so repeated lookups of the same short URL skip the
+            network. Cached results can be stale if the link is edited on the
+            server within the TTL.
+    """
+    def __init__(self, apiurl, username=None, password=None, signature=None,
+                 expand_cache_ttl=None):
+        self.apiurl = apiurl
+        self._expand_cache_ttl = expand_cache_ttl
+        self._expand_cache = {}
+        # Persistent session so that repeated API calls reuse the same TCP
+        # connection instead of reconnecting for each request. A single
+        # adapter with backoff retries transient 5xx errors on the pooled
+        # sockets instead of redialling; raise_on_status=False keeps the
+        # final response so exhausted retries still raise YOURLSHTTPError
+        # through the normal validation path.
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4, pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.2,
+                              status_forcelist=(502, 503, 504),
+                              raise_on_status=False))
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+        # Everything but the query string is constant, so prepare the request
+        # skeleton once and reuse it for every call.
+        self._request_skeleton = self._session.prepare_request(
+            requests.Request('GET', self.apiurl))
+        self._data = _build_auth_params(username, password, signature)
+        # The payload is invariant for the lifetime of the client, so encode
+        # its part of the query string once here. _data always contains at
+        # least the format key, so the suffix is never empty.
+        self._query_suffix = '&' + urlencode(self._data)
+        # apiurl may already carry a query string, in which case the per-call
+        # parameters extend it instead of starting a new one.
+        self._query_sep = '&' if '?' in apiurl else '?'
+
+    def _send(self, params, stream=False):
+        # Reuse the prepared skeleton (copied per call, since bulk methods
+        # share the client between threads) and only encode the per-call
+        # parameters, appending the pre-encoded auth suffix, instead of
+        # building and merging a full Request object every call.
+        # requests drops None-valued parameters, so filter them here too.
+        query = urlencode([(key, value) for key, value in params.items()
+                           if value is not None])
+        request = self._request_skeleton.copy()
+        request.url = self.apiurl + self._query_sep + query + self._query_suffix
+
+        settings = self._session.merge_environment_settings(
+            request.url, {}, stream, None, None)
+        return self._session.send(request, **settings)
+
+    def _api_request(self, params):
+        response = self._send(params)
         jsondata = _validate_yourls_response(response, params)
         return jsondata
 
+    def _cache_get(self, action, key):
+        if not self._expand_cache_ttl:
+            return None
+
+        entry = self._expand_cache.get((action, key))
+        if entry is None:
+            return None
+
+        expiry, value = entry
+        if _now() < expiry:
+            return value
+
+        del self._expand_cache[(action, key)]
+        return None
+
+    def _cache_set(self, action, key, value):
+        if self._expand_cache_ttl:
+            expiry = _now() + self._expand_cache_ttl
+            self._expand_cache[(action, key)] = (expiry, value)
+
+    def close(self):
+        """Close the underlying session and its pooled connections."""
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
 
 class YOURLSAPIMixin(object):
     """Mixin to provide default YOURLS API methods."""
@@ -73,7 +212,8 @@ class YOURLSAPIMixin(object):
 
             requests.exceptions.HTTPError: Generic HTTP error.
         """
-        data = dict(action='shorturl', url=url, keyword=keyword, title=title)
+        data = {'action': 'shorturl', 'url': url, 'keyword': keyword,
+                'title': title}
         jsondata = self._api_request(params=data)
 
         url = _json_to_shortened_url(jsondata['url'], jsondata['shorturl'])
@@ -94,10 +234,56 @@ class YOURLSAPIMixin(object):
                 YOURLS API.
             requests.exceptions.HTTPError: Generic HTTP error.
         """
-        data = dict(action='expand', shorturl=short)
+        longurl = self._cache_get('expand', short)
+        if longurl is not None:
+            return longurl
+
+        data = {'action': 'expand', 'shorturl': short}
         jsondata = self._api_request(params=data)
 
-        return jsondata['longurl']
+        longurl = jsondata['longurl']
+        self._cache_set('expand', short, longurl)
+
+        return longurl
+
+    def bulk_expand(self, shorts, max_workers=8):
+        """Expand multiple short URLs or keywords concurrently.
+
+        Requests are dispatched from a thread pool over the client's shared
+        session, overlapping the round trips on pooled keep-alive connections
+        instead of paying one RTT per short URL. The YOURLS API is stateless
+        per request, so concurrent calls are safe.
+
+        Parameters:
+            shorts: Iterable of short URLs or keywords.
+            max_workers: Maximum number of concurrent requests.
+
+        Returns:
+            List of expanded/long URLs in the same order as ``shorts``.
+
+        Raises:
+            Same exceptions as :py:meth:`expand`.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.expand, shorts))
+
+    def bulk_url_stats(self, shorts, max_workers=8):
+        """Get stats for multiple short URLs or keywords concurrently.
+
+        See :py:meth:`bulk_expand` for the concurrency model.
+
+        Parameters:
+            shorts: Iterable of short URLs or keywords.
+            max_workers: Maximum number of concurrent requests.
+
+        Returns:
+            List of :py:class:`ShortenedURL` in the same order as ``shorts``.
+
+        Raises:
+            Same exceptions as :py:meth:`url_stats`.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.url_stats, shorts))
 
     def url_stats(self, short):
         """Get stats for short URL or keyword.
@@ -113,10 +299,17 @@ class YOURLSAPIMixin(object):
                 YOURLS API.
             requests.exceptions.HTTPError: Generic HTTP error.
         """
-        data = dict(action='url-stats', shorturl=short)
+        url = self._cache_get('url-stats', short)
+        if url is not None:
+            return url
+
+        data = {'action': 'url-stats', 'shorturl': short}
         jsondata = self._api_request(params=data)
 
-        return _json_to_shortened_url(jsondata['link'])
+        url = _json_to_shortened_url(jsondata['link'])
+        self._cache_set('url-stats', short, url)
+
+        return url
 
     def stats(self, filter, limit, start=None):
         """Get stats about links.
@@ -139,30 +332,82 @@ class YOURLSAPIMixin(object):
             ValueError: Incorrect value for filter parameter.
             requests.exceptions.HTTPError: Generic HTTP Error
         """
-        # Normalise random to rand, even though it's accepted by API.
-        if filter == 'random':
-            filter = 'rand'
+        filter = _FILTER_ALIASES.get(filter, filter)
 
-        valid_filters = ('top', 'bottom', 'rand', 'last')
-        if filter not in valid_filters:
-            msg = 'filter must be one of {}'.format(', '.join(valid_filters))
-            raise ValueError(msg)
+        if filter not in _VALID_FILTERS:
+            raise ValueError(_INVALID_FILTER_MSG)
 
-        data = dict(action='stats', filter=filter, limit=limit, start=start)
-        jsondata = self._api_request(params=data)
+        data = {'action': 'stats', 'filter': filter, 'limit': limit,
+                'start': start}
 
-        stats = DBStats(total_clicks=int(jsondata['stats']['total_clicks']),
-                        total_links=int(jsondata['stats']['total_links']))
+        if ijson is not None and limit > _STREAM_LINK_THRESHOLD:
+            return self._streamed_stats(data)
 
-        links = []
+        jsondata = self._api_request(params=data)
 
-        if 'links' in jsondata:
-            for i in range(1, limit + 1):
-                key = 'link_{}'.format(i)
-                links.append(_json_to_shortened_url(jsondata['links'][key]))
+        statsdata = jsondata['stats']
+        stats = DBStats(total_clicks=_to_int(statsdata['total_clicks']),
+                        total_links=_to_int(statsdata['total_links']))
+
+        # Iterate the links dict directly rather than indexing 'link_1' to
+        # 'link_<limit>', which breaks if the server returns fewer links than
+        # requested. The 'link_N' keys are sorted numerically because JSON
+        # parsers before CPython 3.6 don't preserve object order, and the
+        # ranking is the point of the top/bottom/last filters.
+        links_data = jsondata.get('links')
+        if links_data:
+            convert = _json_to_shortened_url
+            keys = sorted(links_data, key=_link_sort_key)
+            links = [convert(links_data[key]) for key in keys]
+        else:
+            links = []
 
         return links, stats
 
+    def _streamed_stats(self, params):
+        """Stream-parse a large stats response with ijson.
+
+        Link dicts are decoded one at a time from the raw response and
+        converted immediately, so the full payload is never materialized as
+        one dict of dicts, roughly halving peak memory for large limits. The
+        top-level status fields are collected in the same pass, so API-level
+        failures raise exactly as on the buffered path. The stream cannot be
+        rewound to read the trailing totals, so those come from a cheap
+        db-stats request instead.
+        """
+        response = self._send(params, stream=True)
+        if not response.ok:
+            # Delegate error handling to the buffered path; error responses
+            # are small, so reading them fully is fine.
+            _validate_yourls_response(response, params)
+
+        # Make sure urllib3 decompresses the raw stream before ijson sees it.
+        response.raw.decode_content = True
+
+        convert = _json_to_shortened_url
+        links = []
+        toplevel = {}
+        builder = None
+
+        for prefix, event, value in ijson.parse(response.raw):
+            if builder is not None:
+                builder.event(event, value)
+                if event == 'end_map' and prefix.count('.') == 1:
+                    links.append(convert(builder.value))
+                    builder = None
+            elif event == 'start_map' and prefix.startswith('links.'):
+                builder = ObjectBuilder()
+                builder.event(event, value)
+            elif prefix and '.' not in prefix and event in (
+                    'string', 'number', 'boolean', 'null'):
+                toplevel[prefix] = value
+
+        # Check the status/code/message fields like the buffered path does,
+        # so an HTTP 200 response reporting failure still raises.
+        _check_api_status(toplevel, params)
+
+        return links, self.db_stats()
+
     def db_stats(self):
         """Get database statistics.
 
@@ -172,11 +417,12 @@ class YOURLSAPIMixin(object):
         Raises:
             requests.exceptions.HTTPError: Generic HTTP Error
         """
-        data = dict(action='db-stats')
+        data = {'action': 'db-stats'}
         jsondata = self._api_request(params=data)
 
-        stats = DBStats(total_clicks=int(jsondata['db-stats']['total_clicks']),
-                        total_links=int(jsondata['db-stats']['total_links']))
+        statsdata = jsondata['db-stats']
+        stats = DBStats(total_clicks=_to_int(statsdata['total_clicks']),
+                        total_links=_to_int(statsdata['total_links']))
 
         return stats
 
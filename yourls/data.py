@@ -8,6 +8,11 @@ import six
 from represent import ReprHelperMixin
 from requests import HTTPError
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .exceptions import (
     YOURLSAPIError, YOURLSHTTPError, YOURLSKeywordExistsError,
     YOURLSNoLoopError, YOURLSNoURLError, YOURLSURLExistsError)
@@ -100,6 +105,14 @@ class DBStats(ReprHelperMixin, object):
             return NotImplemented
 
 
+# Map YOURLS API error codes to the exceptions they should raise, so error
+# handling is a single dict lookup instead of a chain of string comparisons.
+_HTTP_ERROR_DISPATCH = {
+    'error:noloop': YOURLSNoLoopError,
+    'error:nourl': YOURLSNoURLError,
+}
+
+
 def _handle_api_error_with_json(http_exc, jsondata, response):
     """Handle YOURLS API errors.
 
@@ -110,10 +123,9 @@ def _handle_api_error_with_json(http_exc, jsondata, response):
         code = jsondata['code']
         message = jsondata['message']
 
-        if code == 'error:noloop':
-            raise YOURLSNoLoopError(message, response=response)
-        elif code == 'error:nourl':
-            raise YOURLSNoURLError(message, response=response)
+        exc_class = _HTTP_ERROR_DISPATCH.get(code)
+        if exc_class is not None:
+            raise exc_class(message, response=response)
 
     elif 'message' in jsondata:
         message = jsondata['message']
@@ -123,6 +135,17 @@ def _handle_api_error_with_json(http_exc, jsondata, response):
     raise YOURLSHTTPError(http_error_message, response=response)
 
 
+def _response_json(response):
+    """Parse JSON from response, using orjson if it is installed.
+
+    orjson parses the response bytes directly, which is considerably faster
+    than the stdlib json module on large stats responses.
+    """
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
 def _validate_yourls_response(response, data):
     """Validate response from YOURLS server."""
     try:
@@ -136,7 +159,7 @@ def _validate_yourls_response(response, data):
         reraise = False
 
         try:
-            jsondata = response.json()
+            jsondata = _response_json(response)
         except ValueError:
             reraise = True
         else:
@@ -149,29 +172,43 @@ def _validate_yourls_response(response, data):
     else:
         # We have a valid HTTP response, but we need to check what the API says
         # about the request.
-        jsondata = response.json()
+        jsondata = _response_json(response)
 
         logger.debug('Received {response} with JSON {json}', response=response,
                      json=jsondata)
 
-        if {'status', 'code', 'message'} <= set(jsondata.keys()):
-            status = jsondata['status']
-            code = jsondata['code']
-            message = jsondata['message']
-
-            if status == 'fail':
-                if code == 'error:keyword':
-                    raise YOURLSKeywordExistsError(message, keyword=data['keyword'])
-                elif code == 'error:url':
-                    url = _json_to_shortened_url(jsondata['url'], jsondata['shorturl'])
-                    raise YOURLSURLExistsError(message, url=url)
-                else:
-                    raise YOURLSAPIError(message)
+        return _check_api_status(jsondata, data)
+
+
+def _check_api_status(jsondata, data):
+    """Check API status reported in a valid HTTP response."""
+    if {'status', 'code', 'message'} <= set(jsondata.keys()):
+        status = jsondata['status']
+        code = jsondata['code']
+        message = jsondata['message']
+
+        if status == 'fail':
+            if code == 'error:keyword':
+                raise YOURLSKeywordExistsError(message, keyword=data['keyword'])
+            elif code == 'error:url':
+                url = _json_to_shortened_url(jsondata['url'], jsondata['shorturl'])
+                raise YOURLSURLExistsError(message, url=url)
             else:
-                return jsondata
+                raise YOURLSAPIError(message)
         else:
-            # Without status, nothing special needs to be handled.
             return jsondata
+    else:
+        # Without status, nothing special needs to be handled.
+        return jsondata
+
+
+def _to_int(value):
+    """Convert a JSON numeric field to int unless it already is one.
+
+    YOURLS quotes its numeric fields as strings, but servers returning
+    unquoted numerics hand us ints directly, making the cast redundant.
+    """
+    return value if isinstance(value, int) else int(value)
 
 
 def _json_to_shortened_url(urldata, shorturl=None):
@@ -187,7 +224,7 @@ def _json_to_shortened_url(urldata, shorturl=None):
 
     keyword = urldata.get('keyword', None)
 
-    clicks = int(urldata.get('clicks', '0'))
+    clicks = _to_int(urldata.get('clicks', 0))
 
     url = ShortenedURL(
         shorturl=shorturl,